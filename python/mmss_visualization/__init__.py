@@ -20,6 +20,7 @@ from .core import (
 
 from .models import (
     QuaternionField,
+    QuaternionFieldArray,
     DiracSpinor,
     GaugeField,
     Metric,
@@ -32,6 +33,12 @@ from .models import (
     VisualizationStatus,
 )
 
+from .models_fast import (
+    VisualizationPacketFast,
+    encode_packet,
+    decode_packet,
+)
+
 # Set up logging
 import logging
 
@@ -47,30 +54,32 @@ visualizer_3d = Visualizer3D()
 topology_viz = TopologyVisualizer()
 animation_renderer = AnimationRenderer()
 
+# Dispatch table built once at import; visualize() is a single dict lookup
+# instead of a chain of string compares per call.
+_DISPATCH = {
+    "2d": visualizer_2d.render,
+    "3d": visualizer_3d.render,
+    "topology": topology_viz.render,
+    "animation": animation_renderer.render,
+}
+
 def visualize(packet: VisualizationPacket, viz_type: str = "3d", **kwargs):
     """
     Main visualization function that routes to the appropriate visualizer.
-    
+
     Args:
         packet: VisualizationPacket containing EQGFT data
         viz_type: Type of visualization ("2d", "3d", "topology", "animation")
         **kwargs: Additional arguments for the specific visualizer
-        
+
     Returns:
         Visualization result (plot, figure, or animation)
     """
-    viz_type = viz_type.lower()
-    
-    if viz_type == "2d":
-        return visualizer_2d.render(packet, **kwargs)
-    elif viz_type == "3d":
-        return visualizer_3d.render(packet, **kwargs)
-    elif viz_type == "topology":
-        return topology_viz.render(packet, **kwargs)
-    elif viz_type == "animation":
-        return animation_renderer.render(packet, **kwargs)
-    else:
-        raise ValueError(f"Unknown visualization type: {viz_type}")
+    try:
+        render = _DISPATCH[viz_type.lower()]
+    except KeyError:
+        raise ValueError(f"Unknown visualization type: {viz_type}") from None
+    return render(packet, **kwargs)
 
 __all__ = [
     # Core visualization
@@ -86,6 +95,7 @@ __all__ = [
     
     # Data models
     'QuaternionField',
+    'QuaternionFieldArray',
     'DiracSpinor',
     'GaugeField',
     'Metric',
@@ -96,4 +106,9 @@ __all__ = [
     'VisualizationRequest',
     'VisualizationResponse',
     'VisualizationStatus',
+
+    # msgspec fast path
+    'VisualizationPacketFast',
+    'encode_packet',
+    'decode_packet',
 ]
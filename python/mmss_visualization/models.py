@@ -5,24 +5,89 @@ This module defines the Python data models that correspond to the Rust types
 defined in the core MMSS system for EQGFT v2.1.
 """
 
-from typing import Dict, List, Optional, Union, Any
+from typing import Dict, List, Literal, Optional, Union, Any
 from enum import Enum
 from datetime import datetime
-from pydantic import BaseModel, Field
+from functools import cached_property, lru_cache
+from pydantic import BaseModel, ConfigDict, Field, TypeAdapter, field_serializer, field_validator, model_validator
 import numpy as np
-import json
+import orjson
+import msgspec
+import base64
+import struct
+
+from .kernels import quat_mul_gu, quat_rotate_gu
+
+# Shared orjson options for every packet encode.
+_ORJSON_OPTS = orjson.OPT_SERIALIZE_NUMPY
+
+@lru_cache(maxsize=None)
+def adapter_for(tp) -> TypeAdapter:
+    """Memoized TypeAdapter builder — constructing adapters is not free,
+    so parametrized callers share one instance per type."""
+    return TypeAdapter(tp)
+
+def _orjson_default(obj: Any):
+    """Fallback encoder for types orjson does not handle natively."""
+    if isinstance(obj, complex):
+        return {"real": obj.real, "imag": obj.imag}
+    raise TypeError(f"Type is not JSON serializable: {type(obj).__name__}")
+
+def _array_payload(arr: np.ndarray) -> Dict[str, Any]:
+    """JSON-compatible form of an ndarray: dtype/shape plus base64 raw bytes."""
+    return {
+        "dtype": arr.dtype.str,
+        "shape": list(arr.shape),
+        "data": base64.b64encode(np.ascontiguousarray(arr).tobytes()).decode(),
+    }
+
+def _array_from_payload(v: Dict[str, Any]) -> np.ndarray:
+    arr = np.frombuffer(base64.b64decode(v["data"]), dtype=np.dtype(v["dtype"]))
+    return arr.reshape(v["shape"]).copy()
+
+# msgpack Ext code for ndarrays on the binary wire path. The Ext payload is
+# itself msgpack: (dtype str, shape, raw buffer) — no base64 blow-up.
+_NDARRAY_EXT_CODE = 1
+
+def msgpack_enc_hook(obj: Any):
+    """enc_hook for msgspec.msgpack carrying ndarrays as a raw-buffer Ext."""
+    if isinstance(obj, np.ndarray):
+        payload = msgspec.msgpack.encode(
+            (obj.dtype.str, list(obj.shape), np.ascontiguousarray(obj).tobytes()))
+        return msgspec.msgpack.Ext(_NDARRAY_EXT_CODE, payload)
+    if isinstance(obj, complex):
+        return {"real": obj.real, "imag": obj.imag}
+    raise NotImplementedError(f"Cannot encode objects of type {type(obj).__name__}")
+
+def msgpack_ext_hook(code: int, data: memoryview):
+    """ext_hook for msgspec.msgpack restoring ndarrays from the Ext payload."""
+    if code == _NDARRAY_EXT_CODE:
+        dtype, shape, buf = msgspec.msgpack.decode(bytes(data))
+        return np.frombuffer(buf, dtype=np.dtype(dtype)).reshape(shape).copy()
+    raise NotImplementedError(f"Unknown Ext code: {code}")
 
 class QuaternionField(BaseModel):
     """Represents a unit quaternion rotor field Q(x) = q_0(x) + i q_1(x) + j q_2(x) + k q_3(x)"""
+    # Frozen so the cached packed buffer behind to_numpy can never go stale.
+    model_config = ConfigDict(frozen=True)
+
     q0: float = Field(..., description="Real component (q_0)")
     q1: float = Field(..., description="First imaginary component (i)")
     q2: float = Field(..., description="Second imaginary component (j)")
     q3: float = Field(..., description="Third imaginary component (k)")
     coordinates: List[float] = Field(..., description="Spatial coordinates [x, y, z, t]")
-    
+
+    @cached_property
+    def _buf(self) -> bytes:
+        return struct.pack('<4d', self.q0, self.q1, self.q2, self.q3)
+
     def to_numpy(self) -> np.ndarray:
-        """Convert to numpy array [q0, q1, q2, q3]"""
-        return np.array([self.q0, self.q1, self.q2, self.q3])
+        """Convert to numpy array [q0, q1, q2, q3].
+
+        Returns a read-only view of a buffer packed once per instance, so
+        repeated calls allocate no intermediate list of float objects.
+        """
+        return np.frombuffer(self._buf, dtype=np.dtype('<f8'))
     
     @classmethod
     def from_numpy(cls, arr: np.ndarray, coordinates: List[float] = None) -> 'QuaternionField':
@@ -37,55 +102,232 @@ class QuaternionField(BaseModel):
             coordinates=coordinates
         )
 
+    @classmethod
+    def random_batch(cls, n: int) -> np.ndarray:
+        """Draw n uniformly random unit quaternions as an (n, 4) array.
+
+        Vectorized Shoemake sampling — one call replaces n scalar draws and
+        model constructions. Callers that need models wrap individual rows
+        with from_numpy at the edge.
+        """
+        u = np.random.random((n, 3))
+        a = np.sqrt(1.0 - u[:, 0])
+        b = np.sqrt(u[:, 0])
+        two_pi = 2.0 * np.pi
+        q = np.empty((n, 4), dtype=np.float64)
+        q[:, 0] = a * np.sin(two_pi * u[:, 1])
+        q[:, 1] = a * np.cos(two_pi * u[:, 1])
+        q[:, 2] = b * np.sin(two_pi * u[:, 2])
+        q[:, 3] = b * np.cos(two_pi * u[:, 2])
+        return q
+
+    @classmethod
+    def rotate_batch(cls, qs: np.ndarray, vs: np.ndarray) -> np.ndarray:
+        """Rotate a batch of (N, 3) vectors by (N, 4) quaternions"""
+        return quat_rotate_gu(np.asarray(qs, dtype=np.float64),
+                              np.asarray(vs, dtype=np.float64))
+
+class QuaternionFieldArray(BaseModel):
+    """A batch of quaternion field samples in structure-of-arrays layout.
+
+    Stores N samples as two contiguous (N, 4) arrays instead of N
+    QuaternionField models, so downstream math runs as bulk NumPy ops.
+    """
+    model_config = ConfigDict(arbitrary_types_allowed=True)
+
+    dtype: Literal['f4', 'f8'] = Field('f8', description="Storage dtype policy for the sample buffers")
+    quats: np.ndarray = Field(..., description="Quaternion components, shape (N, 4)")
+    coordinates: np.ndarray = Field(..., description="Spatial coordinates [x, y, z, t], shape (N, 4)")
+
+    @field_validator('quats', 'coordinates', mode='before')
+    @classmethod
+    def _coerce_array(cls, v):
+        if isinstance(v, dict):  # serialized form: dtype/shape/raw bytes
+            return _array_from_payload(v)
+        arr = np.asarray(v, dtype=np.float64)
+        return arr.reshape(-1, 4)
+
+    @model_validator(mode='after')
+    def _apply_dtype(self):
+        dt = np.dtype(self.dtype)
+        if self.quats.dtype != dt:
+            self.quats = self.quats.astype(dt)
+        if self.coordinates.dtype != dt:
+            self.coordinates = self.coordinates.astype(dt)
+        return self
+
+    @field_serializer('quats', 'coordinates')
+    def _serialize_array(self, arr: np.ndarray, _info):
+        return _array_payload(arr)
+
+    def __len__(self) -> int:
+        return self.quats.shape[0]
+
+    def multiply(self, other: 'QuaternionFieldArray') -> 'QuaternionFieldArray':
+        """Element-wise Hamilton product with another batch"""
+        return QuaternionFieldArray(
+            dtype=self.dtype,
+            quats=quat_mul_gu(self.quats, other.quats),
+            coordinates=self.coordinates,
+        )
+
+    def rotate(self, vectors: np.ndarray) -> np.ndarray:
+        """Rotate a batch of (N, 3) vectors by the quaternions"""
+        return quat_rotate_gu(self.quats, np.asarray(vectors, dtype=np.float64))
+
+    def to_records(self) -> List['QuaternionField']:
+        """Expand into a list of scalar QuaternionField models"""
+        return [
+            QuaternionField(
+                q0=float(q[0]), q1=float(q[1]), q2=float(q[2]), q3=float(q[3]),
+                coordinates=c.tolist(),
+            )
+            for q, c in zip(self.quats, self.coordinates)
+        ]
+
+    @classmethod
+    def from_records(cls, records: List['QuaternionField']) -> 'QuaternionFieldArray':
+        """Pack a list of scalar QuaternionField models into SoA form"""
+        quats = np.empty((len(records), 4), dtype=np.float64)
+        coords = np.empty((len(records), 4), dtype=np.float64)
+        for i, r in enumerate(records):
+            quats[i] = (r.q0, r.q1, r.q2, r.q3)
+            coords[i] = r.coordinates
+        return cls(quats=quats, coordinates=coords)
+
 class DiracSpinor(BaseModel):
     """Represents a Dirac spinor with 4 complex components"""
-    components: List[complex] = Field(..., description="4 complex spinor components")
+    model_config = ConfigDict(arbitrary_types_allowed=True)
+
+    components: np.ndarray = Field(..., description="4 complex spinor components, complex128")
     vacuum_seed: List[float] = Field(..., description="Vacuum seed spinor (4 real values)")
-    
+
+    @field_validator('components', mode='before')
+    @classmethod
+    def _coerce_components(cls, v):
+        if isinstance(v, dict):  # serialized form: dtype/shape/raw bytes
+            return _array_from_payload(v).astype(np.complex128, copy=False)
+        if isinstance(v, np.ndarray):
+            return v.astype(np.complex128, copy=False).reshape(4)
+        return np.array([
+            complex(c["real"], c["imag"]) if isinstance(c, dict) else complex(c)
+            for c in v
+        ], dtype=np.complex128).reshape(4)
+
+    @field_serializer('components')
+    def _serialize_components(self, arr: np.ndarray, _info):
+        return _array_payload(arr)
+
     def to_numpy(self) -> np.ndarray:
-        """Convert to numpy array of complex numbers"""
-        return np.array(self.components, dtype=np.complex128)
-    
+        """Return the complex128 component buffer (no copy)"""
+        return self.components
+
     @classmethod
     def from_numpy(cls, arr: np.ndarray, vacuum_seed: List[float] = None) -> 'DiracSpinor':
         """Create from numpy array of complex numbers"""
         if vacuum_seed is None:
             vacuum_seed = [1.0, 0.0, 0.0, 0.0]  # Default vacuum state
         return cls(
-            components=[complex(x) for x in arr],
+            components=np.asarray(arr, dtype=np.complex128),
             vacuum_seed=vacuum_seed
         )
 
+# Upper-triangle index pairs of the antisymmetric F_μν, in packing order
+# [F01, F02, F03, F12, F13, F23].
+_TRIU_ROWS, _TRIU_COLS = np.triu_indices(4, k=1)
+
 class GaugeField(BaseModel):
-    """Represents a U(1) gauge field with potential and field strength"""
+    """Represents a U(1) gauge field with potential and field strength.
+
+    F_μν is antisymmetric, so only the 6 upper-triangular components are
+    stored (float32); the dense 4x4 tensor is reconstructed on demand.
+    """
+    model_config = ConfigDict(arbitrary_types_allowed=True, populate_by_name=True)
+
     potential: List[float] = Field(..., description="Gauge potential A_μ (4 components)")
-    field_strength: List[List[float]] = Field(..., description="Field strength F_μν (4x4 antisymmetric tensor)")
-    
+    field_strength_packed: np.ndarray = Field(
+        ...,
+        alias="field_strength",
+        description="Independent F_μν components [F01, F02, F03, F12, F13, F23]",
+    )
+
+    @field_validator('field_strength_packed', mode='before')
+    @classmethod
+    def _pack_field_strength(cls, v):
+        if isinstance(v, dict):  # serialized form: dtype/shape/raw bytes
+            return _array_from_payload(v)
+        arr = np.asarray(v, dtype=np.float32)
+        if arr.shape == (4, 4):  # legacy dense tensor: keep the upper triangle
+            return np.ascontiguousarray(arr[_TRIU_ROWS, _TRIU_COLS])
+        return arr.reshape(6)
+
+    @field_serializer('field_strength_packed')
+    def _serialize_field_strength(self, arr: np.ndarray, _info):
+        return _array_payload(arr)
+
+    def to_dense(self) -> np.ndarray:
+        """Reconstruct the full antisymmetric 4x4 F_μν tensor"""
+        f = np.zeros((4, 4), dtype=self.field_strength_packed.dtype)
+        f[_TRIU_ROWS, _TRIU_COLS] = self.field_strength_packed
+        f[_TRIU_COLS, _TRIU_ROWS] = -self.field_strength_packed
+        return f
+
     def to_numpy(self) -> tuple[np.ndarray, np.ndarray]:
         """Convert to numpy arrays (potential, field_strength)"""
-        return np.array(self.potential), np.array(self.field_strength)
+        return np.array(self.potential), self.to_dense()
 
 class Metric(BaseModel):
     """Represents a Lorentzian metric tensor"""
+    # Frozen so the cached packed buffer behind to_numpy can never go stale.
+    model_config = ConfigDict(frozen=True)
+
     tensor: List[List[float]] = Field(..., description="Metric tensor g_μν (4x4)")
     signature: List[int] = Field(..., description="Signature of the metric, e.g., [-1, 1, 1, 1]")
-    
+    dtype: Literal['f4', 'f8'] = Field('f8', description="dtype returned by to_numpy")
+
+    @cached_property
+    def _buf(self) -> bytes:
+        return struct.pack('<16d', *(x for row in self.tensor for x in row))
+
     def to_numpy(self) -> np.ndarray:
-        """Convert to numpy array"""
-        return np.array(self.tensor)
+        """Convert to numpy array (read-only view of a cached packed buffer)"""
+        arr = np.frombuffer(self._buf, dtype=np.dtype('<f8')).reshape(4, 4)
+        return arr.astype(np.dtype(self.dtype), copy=False)
 
 class EQGFTFields(BaseModel):
     """Container for all EQGFT v2.1 fundamental fields"""
-    quaternion_field: QuaternionField
+    # Frozen so the cached as_soa/coords_soa buffers can never go stale.
+    model_config = ConfigDict(frozen=True)
+
+    quaternion_field: Union[QuaternionField, QuaternionFieldArray]
     dirac_spinor: DiracSpinor
     gauge_field: GaugeField
     metric: Metric
-    
-    class Config:
-        json_encoders = {
-            np.ndarray: lambda v: v.tolist(),
-            complex: lambda v: {"real": v.real, "imag": v.imag}
-        }
+    dtype: Literal['f4', 'f8'] = Field(
+        'f4', description="dtype policy for the SoA visualization buffers; "
+                          "f4 halves bandwidth and is ample for rendering")
+
+    @cached_property
+    def as_soa(self) -> np.ndarray:
+        """Quaternion samples as one contiguous (N, 4) buffer in the policy dtype.
+
+        Computed once per instance so renderers can hand a single array to
+        the plotting backend instead of doing per-point attribute access.
+        """
+        dt = np.dtype(self.dtype)
+        q = self.quaternion_field
+        if isinstance(q, QuaternionFieldArray):
+            return np.ascontiguousarray(q.quats, dtype=dt)
+        return np.array([[q.q0, q.q1, q.q2, q.q3]], dtype=dt)
+
+    @cached_property
+    def coords_soa(self) -> np.ndarray:
+        """Sample coordinates as one contiguous (N, 4) buffer in the policy dtype"""
+        dt = np.dtype(self.dtype)
+        q = self.quaternion_field
+        if isinstance(q, QuaternionFieldArray):
+            return np.ascontiguousarray(q.coordinates, dtype=dt)
+        return np.array([q.coordinates], dtype=dt)
 
 class EQGFTAction(BaseModel):
     """Action terms for EQGFT v2.1"""
@@ -122,12 +364,20 @@ class VisualizationPacket(BaseModel):
     
     def to_json(self, **kwargs) -> str:
         """Serialize to JSON string"""
-        return self.json(**kwargs)
+        return orjson.dumps(
+            self.model_dump(**kwargs),
+            default=_orjson_default,
+            option=_ORJSON_OPTS,
+        ).decode()
     
     @classmethod
-    def from_json(cls, json_str: str) -> 'VisualizationPacket':
-        """Deserialize from JSON string"""
-        return cls.parse_raw(json_str)
+    def from_json(cls, json_str: Union[str, bytes]) -> 'VisualizationPacket':
+        """Deserialize from a JSON string or bytes"""
+        return _packet_adapter.validate_json(json_str)
+
+# Built once at import; validate_json parses bytes directly in Rust without
+# an intermediate Python dict, so reuse it for every packet decode.
+_packet_adapter = adapter_for(VisualizationPacket)
 
 class VisualizationRequest(BaseModel):
     """Request for visualization"""
@@ -145,10 +395,14 @@ class VisualizationResponse(BaseModel):
 # Utility functions
 def save_visualization(packet: VisualizationPacket, filepath: str) -> None:
     """Save visualization packet to a JSON file"""
-    with open(filepath, 'w') as f:
-        f.write(packet.json(indent=2))
+    with open(filepath, 'wb') as f:
+        f.write(orjson.dumps(
+            packet.model_dump(),
+            default=_orjson_default,
+            option=_ORJSON_OPTS | orjson.OPT_INDENT_2,
+        ))
 
 def load_visualization(filepath: str) -> VisualizationPacket:
     """Load visualization packet from a JSON file"""
-    with open(filepath, 'r') as f:
-        return VisualizationPacket.parse_raw(f.read())
+    with open(filepath, 'rb', buffering=65536) as f:
+        return _packet_adapter.validate_json(f.read())
@@ -0,0 +1,174 @@
+"""
+msgspec.Struct mirrors of the hot visualization models.
+
+These carry the same data as the Pydantic models in models.py but skip
+per-field validation and encode positionally (array_like), which makes the
+RPC/file round-trip several times cheaper. Use them on trusted hot paths
+and call .to_pydantic() only where full validation is needed; the batched
+QuaternionFieldArray form stays on the Pydantic path.
+"""
+
+from datetime import datetime
+from typing import Any, Dict, List
+
+import msgspec
+
+from . import models
+
+class QuaternionFieldFast(msgspec.Struct, array_like=True):
+    q0: float
+    q1: float
+    q2: float
+    q3: float
+    coordinates: List[float]
+
+    @classmethod
+    def from_pydantic(cls, m: 'models.QuaternionField') -> 'QuaternionFieldFast':
+        return cls(q0=m.q0, q1=m.q1, q2=m.q2, q3=m.q3, coordinates=list(m.coordinates))
+
+    def to_pydantic(self) -> 'models.QuaternionField':
+        return models.QuaternionField(
+            q0=self.q0, q1=self.q1, q2=self.q2, q3=self.q3,
+            coordinates=self.coordinates,
+        )
+
+class DiracSpinorFast(msgspec.Struct, array_like=True):
+    components: List[List[float]]  # [real, imag] pairs
+    vacuum_seed: List[float]
+
+    @classmethod
+    def from_pydantic(cls, m: 'models.DiracSpinor') -> 'DiracSpinorFast':
+        # components is a complex128 ndarray; go through float() so the
+        # cells are Python floats msgspec can encode, not numpy.float64.
+        return cls(
+            components=[[float(c.real), float(c.imag)] for c in m.components],
+            vacuum_seed=[float(x) for x in m.vacuum_seed],
+        )
+
+    def to_pydantic(self) -> 'models.DiracSpinor':
+        return models.DiracSpinor(
+            components=[complex(r, i) for r, i in self.components],
+            vacuum_seed=self.vacuum_seed,
+        )
+
+class GaugeFieldFast(msgspec.Struct, array_like=True):
+    potential: List[float]
+    field_strength: List[float]  # packed [F01, F02, F03, F12, F13, F23]
+
+    @classmethod
+    def from_pydantic(cls, m: 'models.GaugeField') -> 'GaugeFieldFast':
+        return cls(
+            potential=list(m.potential),
+            field_strength=m.field_strength_packed.tolist(),
+        )
+
+    def to_pydantic(self) -> 'models.GaugeField':
+        return models.GaugeField(
+            potential=self.potential,
+            field_strength=self.field_strength,
+        )
+
+class MetricFast(msgspec.Struct, array_like=True):
+    tensor: List[List[float]]
+    signature: List[int]
+
+    @classmethod
+    def from_pydantic(cls, m: 'models.Metric') -> 'MetricFast':
+        return cls(tensor=[list(row) for row in m.tensor], signature=list(m.signature))
+
+    def to_pydantic(self) -> 'models.Metric':
+        return models.Metric(tensor=self.tensor, signature=self.signature)
+
+class EQGFTFieldsFast(msgspec.Struct, array_like=True):
+    quaternion_field: QuaternionFieldFast
+    dirac_spinor: DiracSpinorFast
+    gauge_field: GaugeFieldFast
+    metric: MetricFast
+
+    @classmethod
+    def from_pydantic(cls, m: 'models.EQGFTFields') -> 'EQGFTFieldsFast':
+        return cls(
+            quaternion_field=QuaternionFieldFast.from_pydantic(m.quaternion_field),
+            dirac_spinor=DiracSpinorFast.from_pydantic(m.dirac_spinor),
+            gauge_field=GaugeFieldFast.from_pydantic(m.gauge_field),
+            metric=MetricFast.from_pydantic(m.metric),
+        )
+
+    def to_pydantic(self) -> 'models.EQGFTFields':
+        return models.EQGFTFields(
+            quaternion_field=self.quaternion_field.to_pydantic(),
+            dirac_spinor=self.dirac_spinor.to_pydantic(),
+            gauge_field=self.gauge_field.to_pydantic(),
+            metric=self.metric.to_pydantic(),
+        )
+
+class EQGFTActionFast(msgspec.Struct, array_like=True):
+    gravity: float
+    quaternion_kinetic: float
+    constraint: float
+    fermion_mass: float
+    geometric_current: List[float]
+
+    @classmethod
+    def from_pydantic(cls, m: 'models.EQGFTAction') -> 'EQGFTActionFast':
+        return cls(
+            gravity=m.gravity,
+            quaternion_kinetic=m.quaternion_kinetic,
+            constraint=m.constraint,
+            fermion_mass=m.fermion_mass,
+            geometric_current=list(m.geometric_current),
+        )
+
+    def to_pydantic(self) -> 'models.EQGFTAction':
+        return models.EQGFTAction(
+            gravity=self.gravity,
+            quaternion_kinetic=self.quaternion_kinetic,
+            constraint=self.constraint,
+            fermion_mass=self.fermion_mass,
+            geometric_current=self.geometric_current,
+        )
+
+class VisualizationPacketFast(msgspec.Struct):
+    id: str
+    timestamp: datetime
+    fields: EQGFTFieldsFast
+    action: EQGFTActionFast
+    metrics: Dict[str, float]
+    visualization_type: str
+    metadata: Dict[str, Any] = {}
+
+    @classmethod
+    def from_pydantic(cls, m: 'models.VisualizationPacket') -> 'VisualizationPacketFast':
+        return cls(
+            id=m.id,
+            timestamp=m.timestamp,
+            fields=EQGFTFieldsFast.from_pydantic(m.fields),
+            action=EQGFTActionFast.from_pydantic(m.action),
+            metrics=dict(m.metrics),
+            visualization_type=m.visualization_type.value,
+            metadata=dict(m.metadata),
+        )
+
+    def to_pydantic(self) -> 'models.VisualizationPacket':
+        return models.VisualizationPacket(
+            id=self.id,
+            timestamp=self.timestamp,
+            fields=self.fields.to_pydantic(),
+            action=self.action.to_pydantic(),
+            metrics=self.metrics,
+            visualization_type=self.visualization_type,
+            metadata=self.metadata,
+        )
+
+# Encoder/Decoder construction is not free; build each once at import and
+# reuse for every packet.
+_encoder = msgspec.json.Encoder()
+_decoder = msgspec.json.Decoder(VisualizationPacketFast)
+
+def encode_packet(packet: VisualizationPacketFast) -> bytes:
+    """Encode a fast packet to JSON bytes"""
+    return _encoder.encode(packet)
+
+def decode_packet(data: bytes) -> VisualizationPacketFast:
+    """Decode JSON bytes into a fast packet"""
+    return _decoder.decode(data)
@@ -0,0 +1,31 @@
+import sys
+import types
+from pathlib import Path
+
+# Make the package importable without an install step; CI runs pytest
+# straight from the checkout.
+_PKG_ROOT = Path(__file__).resolve().parents[1]
+if str(_PKG_ROOT) not in sys.path:
+    sys.path.insert(0, str(_PKG_ROOT))
+
+if not (_PKG_ROOT / "mmss_visualization" / "core.py").exists():
+    # The rendering core module is not shipped in this tree, but the package
+    # __init__ imports it. Register a minimal stand-in before the package is
+    # imported so the model/serialization tests can run; anything touching
+    # the renderers raises instead of silently no-op'ing.
+    core = types.ModuleType("mmss_visualization.core")
+
+    class _StubRenderer:
+        def render(self, packet, **kwargs):
+            raise NotImplementedError("rendering core not available in this tree")
+
+    def _unavailable(*args, **kwargs):
+        raise NotImplementedError("rendering core not available in this tree")
+
+    for _name in ("Visualizer2D", "Visualizer3D", "TopologyVisualizer", "AnimationRenderer"):
+        setattr(core, _name, type(_name, (_StubRenderer,), {}))
+    for _name in ("render_visualization", "create_visualization_packet",
+                  "save_visualization", "load_visualization"):
+        setattr(core, _name, _unavailable)
+
+    sys.modules["mmss_visualization.core"] = core
@@ -0,0 +1,52 @@
+from datetime import datetime, timezone
+
+import numpy as np
+
+from mmss_visualization import models
+from mmss_visualization.models_fast import (
+    VisualizationPacketFast,
+    encode_packet,
+    decode_packet,
+)
+
+def _sample_packet() -> models.VisualizationPacket:
+    fields = models.EQGFTFields(
+        quaternion_field=models.QuaternionField(
+            q0=1.0, q1=0.0, q2=0.0, q3=0.0,
+            coordinates=[0.0, 0.0, 0.0, 0.0]),
+        dirac_spinor=models.DiracSpinor(
+            components=np.array([1 + 2j, 0j, 0j, 3 - 1j]),
+            vacuum_seed=[1.0, 0.0, 0.0, 0.0]),
+        gauge_field=models.GaugeField(
+            potential=[0.0, 0.1, 0.2, 0.3],
+            field_strength=[[0.0] * 4 for _ in range(4)]),
+        metric=models.Metric(
+            tensor=[[-1.0, 0.0, 0.0, 0.0],
+                    [0.0, 1.0, 0.0, 0.0],
+                    [0.0, 0.0, 1.0, 0.0],
+                    [0.0, 0.0, 0.0, 1.0]],
+            signature=[-1, 1, 1, 1]),
+    )
+    action = models.EQGFTAction(
+        gravity=0.1, quaternion_kinetic=0.2, constraint=0.0,
+        fermion_mass=0.3, geometric_current=[0.0, 0.0, 0.0, 0.0])
+    return models.VisualizationPacket(
+        id="pkt-1",
+        timestamp=datetime(2026, 1, 1, tzinfo=timezone.utc),
+        fields=fields,
+        action=action,
+        metrics={"energy": 1.5},
+        visualization_type=models.VisualizationType.PLOT_3D,
+    )
+
+def test_fast_packet_round_trip():
+    pkt = _sample_packet()
+    fast = VisualizationPacketFast.from_pydantic(pkt)
+    decoded = decode_packet(encode_packet(fast))
+    assert decoded == fast
+
+    restored = decoded.to_pydantic()
+    assert restored.id == pkt.id
+    assert restored.visualization_type == pkt.visualization_type
+    assert np.allclose(restored.fields.dirac_spinor.components,
+                       pkt.fields.dirac_spinor.components)
@@ -1,42 +1,93 @@
 ﻿import argparse
+import asyncio
+import concurrent.futures
+import numpy as np
 import pandas as pd
 import pyarrow as pa
 import plotly.graph_objects as go
-from plotly.subplots import make_subplots
+import plotly.io as pio
 import panel as pn
-import json
+import orjson
+
+# Figure JSON is emitted in the dashboard callback path; orjson serializes
+# the numeric trace arrays ~10x faster than the stdlib engine, and skipping
+# the default template avoids a deep merge per figure.
+pio.json.config.default_engine = "orjson"
+pio.templates.default = None
+
+# Payloads share a fixed {"value": float, ...} schema, so a typed msgspec
+# decoder (one instance, reused for every row) hits the SIMD scanner and
+# skips dict allocation entirely. orjson covers the no-msgspec case.
+try:
+    import msgspec
+
+    class _Payload(msgspec.Struct):
+        value: float
+
+    _payload_decoder = msgspec.json.Decoder(_Payload)
+
+    def _decode_value(x):
+        return _payload_decoder.decode(x).value if isinstance(x, (bytes, str)) else x["value"]
+except ImportError:
+    def _decode_value(x):
+        return orjson.loads(x)["value"] if isinstance(x, (bytes, str)) else x["value"]
 
 class MmssVisualizer:
-    def __init__(self, file_path):
+    def __init__(self, file_path, fp32=False):
         self.file_path = file_path
-        self.df = self._load_data()
-        # Parse JSON strings in payload
-        self.df['payload'] = self.df['payload'].apply(lambda x: json.loads(x) if isinstance(x, str) else x)
-    
+        self.table = self._load_data()
+        # Only timestamp and kind are materialized as pandas columns; the
+        # payload column is kept in Arrow and consumed by the one eager
+        # decode pass below.
+        self.df = self.table.select(["timestamp", "kind"]).to_pandas(types_mapper=pd.ArrowDtype)
+        self._payload = self.table.column("payload")
+        # One vectorized decode pass over the whole payload column up front;
+        # per-trace work is then pure array indexing. Note to_pylist() pages
+        # in the entire column, so the memory-mapped load's lazy paging only
+        # helps columns we never touch.
+        raw = self._payload.to_pylist()
+        self._values = np.fromiter(
+            (_decode_value(x) for x in raw),
+            dtype=np.float64, count=len(raw))
+        if fp32:  # halve the value buffer; plot precision is unaffected
+            self._values = self._values.astype(np.float32)
+        self._ts = pd.to_datetime(self.df["timestamp"].to_numpy(), unit="s")
+        self._groups = self.df.groupby("kind", sort=False).indices
+        # Dashboard callbacks build figures on this pool so the Bokeh IO
+        # thread never blocks on trace assembly; finished figures are cached
+        # per metric selection.
+        self._executor = concurrent.futures.ThreadPoolExecutor(max_workers=2)
+        self._figure_cache = {}
+
     def _load_data(self):
-        with pa.OSFile(self.file_path, "rb") as f:
-            reader = pa.ipc.open_file(f)
-            table = reader.read_all()
-            return table.to_pandas()
-    
-    def plot_timeseries(self, title="MMSS Metrics"):
-        fig = make_subplots(specs=[[{"secondary_y": True}]])
-        for kind in self.df["kind"].unique():
-            df_kind = self.df[self.df["kind"] == kind]
-            fig.add_trace(go.Scatter(
-                x=pd.to_datetime(df_kind["timestamp"], unit="s"),
-                y=df_kind["payload"].apply(lambda x: x["value"]),
+        # Memory-map the IPC file so Arrow serves columns as zero-copy views
+        # that are paged in on demand, instead of copying every buffer.
+        src = pa.memory_map(self.file_path, "r")
+        return pa.ipc.open_file(src).read_all()
+
+    def _build_figure(self, kinds=None, title="MMSS Metrics"):
+        # Build all traces up front and hand them to the figure in one go;
+        # Scattergl keeps large series on the WebGL path.
+        traces = [
+            go.Scattergl(
+                x=self._ts[idx],
+                y=self._values[idx],
                 name=kind,
                 mode="lines+markers"
-            ))
-        fig.update_layout(
+            )
+            for kind, idx in self._groups.items()
+            if kinds is None or kind in kinds
+        ]
+        return go.Figure(data=traces, layout=go.Layout(
             title=title,
             xaxis_title="Time",
             yaxis_title="Value",
             legend_title="Metrics",
             hovermode="x unified"
-        )
-        return fig
+        ))
+
+    def plot_timeseries(self, title="MMSS Metrics"):
+        return self._build_figure(title=title)
     
     def interactive_dashboard(self, port=5006):
         pn.extension("plotly")
@@ -47,9 +98,15 @@ class MmssVisualizer:
         )
         
         @pn.depends(metric_selector.param.value)
-        def update_plot(metrics):
-            fig = self.plot_timeseries()
-            fig.data = [trace for trace in fig.data if trace.name in metrics]
+        async def update_plot(metrics):
+            # Trace assembly runs on the worker pool; re-selecting an
+            # already-built combination is a cache hit.
+            key = frozenset(metrics)
+            fig = self._figure_cache.get(key)
+            if fig is None:
+                loop = asyncio.get_running_loop()
+                fig = await loop.run_in_executor(self._executor, self._build_figure, key)
+                self._figure_cache[key] = fig
             return fig
         
         dashboard = pn.Column(
@@ -68,9 +125,10 @@ def main():
     parser.add_argument("input", help="Path to Arrow file")
     parser.add_argument("--dashboard", action="store_true", help="Launch interactive dashboard")
     parser.add_argument("--port", type=int, default=5006, help="Port for the dashboard")
+    parser.add_argument("--fp32", action="store_true", help="Keep decoded values as float32 to halve memory")
     args = parser.parse_args()
-    
-    viz = MmssVisualizer(args.input)
+
+    viz = MmssVisualizer(args.input, fp32=args.fp32)
     if args.dashboard:
         viz.interactive_dashboard(port=args.port)
     else: